@@ -64,6 +64,11 @@ export class SignInRateLimiter {
     }
   }
 
+  /** How many windows are held, including expired ones not yet swept. */
+  public get trackedWindowCount(): number {
+    return this.attempts.size;
+  }
+
   public check(email: string, source: string): SignInRateLimitDecision {
     const now = this.now();
     this.prune(now);
@@ -147,11 +152,19 @@ export class SignInRateLimiter {
     }
   }
 
+  /**
+   * Every window lasts the same length of time and is only ever appended, so
+   * the oldest expire first and the sweep can stop at the first live one rather
+   * than visit the whole bounded map on every check. A window that a backwards
+   * clock step leaves behind it is discarded by `current` instead.
+   */
   private prune(now: number): void {
     for (const [key, window] of this.attempts) {
-      if (window.expiresAt <= now) {
-        this.attempts.delete(key);
+      if (window.expiresAt > now) {
+        return;
       }
+
+      this.attempts.delete(key);
     }
   }
 }
@@ -10,7 +10,7 @@ import { sql, type Kysely } from "kysely";
 
 import type { JobsService } from "../jobs/jobs.service";
 import {
-  jobSiteStock,
+  jobSiteStockFor,
   listItems,
   listOpenReservations,
   listStockRequests,
@@ -105,13 +105,10 @@ export class DashboardService {
   /** The jobs this person is on, each with whatever is sitting on its site. */
   private async assignedJobs(userId: string): Promise<readonly EngineerJobView[]> {
     const jobs = await this.jobs.list({ assignedTo: userId, status: "Open" });
+    /* One query for every site, however many jobs the engineer is on. */
+    const stock = await jobSiteStockFor(this.database, jobs.map((job) => job.jobSiteLocationId));
 
-    return Promise.all(
-      jobs.map(async (job) => ({
-        ...job,
-        jobSiteStock: await jobSiteStock(this.database, job.jobSiteLocationId),
-      })),
-    );
+    return jobs.map((job) => ({ ...job, jobSiteStock: stock.get(job.jobSiteLocationId) ?? [] }));
   }
 
   /**
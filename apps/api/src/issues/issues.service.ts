@@ -32,6 +32,11 @@ const REPORTS_PER_WINDOW = 5;
 const REPORT_WINDOW_MILLISECONDS = 60 * 60 * 1_000;
 const MAX_TRACKED_REPORTERS = 1_000;
 
+interface ReportWindow {
+  count: number;
+  readonly expiresAt: number;
+}
+
 /**
  * A bounded per-reporter throttle. This endpoint spends the installation's
  * GitHub credential and writes to a repository the whole world can read, so an
@@ -40,21 +45,15 @@ const MAX_TRACKED_REPORTERS = 1_000;
  * session. The key is the user id from the session, which the caller cannot
  * choose.
  */
-class ReportThrottle {
-  private readonly windows = new Map<string, { count: number; readonly expiresAt: number }>();
+export class ReportThrottle {
+  private readonly windows = new Map<string, ReportWindow>();
 
   public constructor(private readonly now: () => number = Date.now) {}
 
   public allow(userId: string): boolean {
     const now = this.now();
-
-    for (const [key, window] of this.windows) {
-      if (window.expiresAt <= now) {
-        this.windows.delete(key);
-      }
-    }
-
-    const current = this.windows.get(userId);
+    this.prune(now);
+    const current = this.current(userId, now);
 
     if (current === undefined) {
       if (this.windows.size >= MAX_TRACKED_REPORTERS) {
@@ -73,6 +72,32 @@ class ReportThrottle {
     current.count += 1;
     return true;
   }
+
+  private current(userId: string, now: number): ReportWindow | undefined {
+    const window = this.windows.get(userId);
+
+    if (window !== undefined && window.expiresAt <= now) {
+      this.windows.delete(userId);
+      return undefined;
+    }
+
+    return window;
+  }
+
+  /**
+   * Windows all last an hour and are only ever appended, so the oldest expire
+   * first and the sweep can stop at the first live one. A window that a
+   * backwards clock step leaves behind it is discarded by `current` instead.
+   */
+  private prune(now: number): void {
+    for (const [userId, window] of this.windows) {
+      if (window.expiresAt > now) {
+        return;
+      }
+
+      this.windows.delete(userId);
+    }
+  }
 }
 
 function configurationFrom(environment: NodeJS.ProcessEnv): GitHubConfiguration | undefined {
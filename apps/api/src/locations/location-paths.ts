@@ -21,24 +21,57 @@ export const locationPaths = (rows: readonly PathRow[]): ReadonlyMap<string, Loc
   const byId = new Map(rows.map((row) => [row.id, row]));
   const resolved = new Map<string, LocationPath>();
 
-  const resolve = (id: string): LocationPath => {
-    const cached = resolved.get(id);
-    if (cached !== undefined) return cached;
-    const row = byId.get(id);
-    if (row === undefined) return { path: "", depth: 0 };
+  /*
+   * Once round a parent cycle, ending at the given row. Containment ranking
+   * cannot close a loop, so a stored cycle would mean damaged data; this keeps
+   * the breadcrumb finite if it ever happens.
+   */
+  const aroundCycle = (row: PathRow): LocationPath => {
     const trail: string[] = [];
     const seen = new Set<string>();
     let cursor: PathRow | undefined = row;
     while (cursor !== undefined && !seen.has(cursor.id)) {
       seen.add(cursor.id);
-      trail.unshift(cursor.name);
+      trail.push(cursor.name);
       cursor = cursor.derived_parent_id === null ? undefined : byId.get(cursor.derived_parent_id);
     }
-    const value = { path: trail.join(PATH_SEPARATOR), depth: trail.length - 1 };
-    resolved.set(id, value);
-    return value;
+    trail.reverse();
+    return { path: trail.join(PATH_SEPARATOR), depth: trail.length - 1 };
   };
 
-  for (const row of rows) resolve(row.id);
+  /*
+   * Climbs only as far as the first ancestor already resolved and extends its
+   * path back down, so each shared ancestor is resolved once.
+   */
+  const resolve = (row: PathRow): void => {
+    const climb: PathRow[] = [];
+    const climbed = new Set<string>();
+    let above: LocationPath | undefined;
+    let cursor: PathRow | undefined = row;
+    while (cursor !== undefined) {
+      above = resolved.get(cursor.id);
+      if (above !== undefined) break;
+      if (climbed.has(cursor.id)) {
+        const entry = cursor.id;
+        const members = climb.splice(climb.findIndex((step) => step.id === entry));
+        for (const member of members) resolved.set(member.id, aroundCycle(member));
+        above = resolved.get(entry);
+        break;
+      }
+      climbed.add(cursor.id);
+      climb.push(cursor);
+      cursor = cursor.derived_parent_id === null ? undefined : byId.get(cursor.derived_parent_id);
+    }
+    for (let index = climb.length - 1; index >= 0; index -= 1) {
+      const step = climb[index]!;
+      above =
+        above === undefined
+          ? { path: step.name, depth: 0 }
+          : { path: `${above.path}${PATH_SEPARATOR}${step.name}`, depth: above.depth + 1 };
+      resolved.set(step.id, above);
+    }
+  };
+
+  for (const row of rows) resolve(row);
   return resolved;
 };
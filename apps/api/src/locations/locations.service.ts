@@ -15,12 +15,13 @@ import type {
 } from "@stockcontrol/contracts";
 import { optimisticConflict, resourceUnavailable, validationFailed } from "@stockcontrol/contracts";
 import {
+  childrenByParent,
   createLocationCode,
   createLocationId,
   createLocationName,
   createMapId,
   deriveContainment,
-  descendantIds,
+  descendantsIn,
   LocationDomainError,
   LocationMap,
   retirementOutcome,
@@ -41,6 +42,14 @@ const JPEG_START = Buffer.from([0xff, 0xd8]);
 const MAX_FLOOR_PLAN_DIMENSION = 20_000;
 const MAX_FLOOR_PLAN_PIXELS = 100_000_000;
 
+interface LocationStockRow {
+  readonly location_id: string;
+  readonly item_id: string;
+  readonly quantity: string;
+  readonly item_name: string;
+  readonly low_stock_threshold: string | null;
+}
+
 interface DecodedFloorPlan {
   readonly bytes: Buffer;
   readonly width: number;
@@ -259,8 +268,7 @@ export class LocationsService {
         validationFailed({ query: ["Enter 1-100 search characters."] }),
       );
     const rows = await this.repository.listLocations();
-    const paths = locationPaths(rows);
-    return rows
+    const matches = rows
       .filter((row) => row.kind === "Store")
       .flatMap((row) => {
         const matchedOn = row.code.toLocaleLowerCase("en-GB").includes(needle)
@@ -272,24 +280,29 @@ export class LocationsService {
                 )
               ? ("alias" as const)
               : undefined;
-        if (matchedOn === undefined) return [];
-        return [
-          {
-            id: row.id,
-            code: row.code,
-            name: row.name,
-            path: paths.get(row.id)?.path ?? row.name,
-            status: row.is_active ? ("Active" as const) : ("Archived" as const),
-            mapId: row.map_id,
-            matchedOn,
-          },
-        ];
+        return matchedOn === undefined ? [] : [{ row, matchedOn }];
       });
+    /* A query that matches nothing needs no breadcrumbs, which walk every location. */
+    if (matches.length === 0) return [];
+    const paths = locationPaths(rows);
+    return matches.map(({ row, matchedOn }) => ({
+      id: row.id,
+      code: row.code,
+      name: row.name,
+      path: paths.get(row.id)?.path ?? row.name,
+      status: row.is_active ? ("Active" as const) : ("Archived" as const),
+      mapId: row.map_id,
+      matchedOn,
+    }));
   }
 
   public async maps(): Promise<readonly MapSummaryView[]> {
-    const rows = await this.repository.listLocations();
-    const maps = await this.repository.listMaps();
+    const [rows, maps] = await Promise.all([
+      this.repository.listLocations(),
+      this.repository.listMaps(),
+    ]);
+    const counts = new Map<string | null, number>();
+    for (const row of rows) counts.set(row.map_id, (counts.get(row.map_id) ?? 0) + 1);
     return maps.map((map) => ({
       id: map.id,
       code: map.code,
@@ -297,7 +310,7 @@ export class LocationsService {
       status: map.status,
       revision: map.revision,
       background: backgroundFor(map),
-      locationCount: rows.filter((row) => row.map_id === map.id).length,
+      locationCount: counts.get(map.id) ?? 0,
     }));
   }
 
@@ -787,20 +800,34 @@ export class LocationsService {
   }
 
   private async view(map: MapRow, mapRows: readonly LocationRow[]): Promise<MapView> {
-    const allRows = await this.repository.listLocations();
+    const [allRows, stockRows] = await Promise.all([
+      this.repository.listLocations(),
+      this.database
+        .withSchema(SCHEMA)
+        .selectFrom("stock_levels")
+        .innerJoin("items", "items.id", "stock_levels.item_id")
+        .select([
+          "stock_levels.location_id as location_id",
+          "stock_levels.item_id as item_id",
+          "stock_levels.quantity as quantity",
+          "items.name as item_name",
+          "items.low_stock_threshold as low_stock_threshold",
+        ])
+        .execute(),
+    ]);
     const parents = new Map(allRows.map((row) => [row.id, row.derived_parent_id] as const));
-    const stockRows = await this.database
-      .withSchema(SCHEMA)
-      .selectFrom("stock_levels")
-      .innerJoin("items", "items.id", "stock_levels.item_id")
-      .select([
-        "stock_levels.location_id as location_id",
-        "stock_levels.item_id as item_id",
-        "stock_levels.quantity as quantity",
-        "items.name as item_name",
-        "items.low_stock_threshold as low_stock_threshold",
-      ])
-      .execute();
+    /* Every location on the map walks its own subtree, so they share one index. */
+    const children = childrenByParent(parents);
+    /*
+     * Each location summarises the stock of its whole subtree, so the rows are
+     * grouped once and each contained location is a lookup.
+     */
+    const stockByLocation = new Map<string, LocationStockRow[]>();
+    for (const stock of stockRows) {
+      const held = stockByLocation.get(stock.location_id);
+      if (held === undefined) stockByLocation.set(stock.location_id, [stock]);
+      else held.push(stock);
+    }
     const paths = locationPaths(allRows);
     return {
       id: map.id,
@@ -809,27 +836,23 @@ export class LocationsService {
       status: map.status,
       revision: map.revision,
       background: backgroundFor(map),
-      locations: mapRows.map((row) => this.locationView(row, parents, stockRows, paths)),
+      locations: mapRows.map((row) =>
+        this.locationView(row, children, stockByLocation, paths),
+      ),
       capabilities: ["view", "search"],
     };
   }
 
   private locationView(
     row: LocationRow,
-    parents: ReadonlyMap<string, string | null>,
-    stockRows: readonly {
-      readonly location_id: string;
-      readonly item_id: string;
-      readonly quantity: string;
-      readonly item_name: string;
-      readonly low_stock_threshold: string | null;
-    }[],
+    children: ReadonlyMap<string, readonly string[]>,
+    stockByLocation: ReadonlyMap<string, readonly LocationStockRow[]>,
     paths: ReadonlyMap<string, { readonly path: string; readonly depth: number }>,
   ): MapLocationView {
-    const within = descendantIds(parents, row.id);
-    const held = stockRows.filter(
-      (stock) => within.has(stock.location_id) && Number(stock.quantity) > 0,
-    );
+    const within = descendantsIn(children, row.id);
+    const held = [...within]
+      .flatMap((id) => stockByLocation.get(id) ?? [])
+      .filter((stock) => Number(stock.quantity) > 0);
     const quantity = held.reduce((total, stock) => total + Number(stock.quantity), 0);
     const itemTotals = new Map<string, { readonly name: string; readonly quantity: string }>();
     for (const stock of held) {
@@ -142,8 +142,10 @@ export class S3PrivateObjectStorage implements PrivateObjectStorage {
     if (response.Body === undefined) {
       throw new Error("Private image storage returned an object without content.");
     }
+    const body = await response.Body.transformToByteArray();
     return {
-      bytes: Buffer.from(await response.Body.transformToByteArray()),
+      /* Wraps the SDK's bytes without copying. */
+      bytes: Buffer.from(body.buffer, body.byteOffset, body.byteLength),
       mediaType: response.ContentType ?? "application/octet-stream",
     };
   }
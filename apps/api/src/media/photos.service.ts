@@ -51,6 +51,10 @@ export const matchesStoredPhoto = (
   );
 };
 
+/* The photo id changes with every upload, so a replaced photo never comes from a cached copy. */
+const profilePhotoUrlFor = (userId: string, photoId: string): string =>
+  `/api/v1/users/${userId}/profile-photo?v=${photoId}`;
+
 export class PhotosService {
   private readonly maxBytes: number;
 
@@ -69,7 +73,22 @@ export class PhotosService {
       .select("id")
       .where("user_id", "=", userId)
       .executeTakeFirst();
-    return row === undefined ? null : `/api/v1/users/${userId}/profile-photo?v=${row.id}`;
+    return row === undefined ? null : profilePhotoUrlFor(userId, row.id);
+  }
+
+  /**
+   * The same URLs for a whole list of users in one query. A user without a
+   * profile photo has no entry.
+   */
+  public async profilePhotoUrls(userIds: readonly string[]): Promise<ReadonlyMap<string, string>> {
+    if (userIds.length === 0) return new Map();
+    const rows = await this.database
+      .withSchema(SCHEMA)
+      .selectFrom("user_profile_photos")
+      .select(["user_id", "id"])
+      .where("user_id", "in", userIds)
+      .execute();
+    return new Map(rows.map((row) => [row.user_id, profilePhotoUrlFor(row.user_id, row.id)]));
   }
 
   public async itemPhotos(itemId: string): Promise<readonly ItemPhotoView[]> {
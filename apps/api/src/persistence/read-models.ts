@@ -81,6 +81,13 @@ function primaryPhotoUrl(itemId: string, photoId: string | null): string | null
   return photoId === null ? null : `/api/v1/items/${itemId}/photos/${photoId}`;
 }
 
+/* Appends in place, so building a group takes time linear in its size. */
+function appendTo<Value>(grouped: Map<string, Value[]>, key: string, value: Value): void {
+  const group = grouped.get(key);
+  if (group === undefined) grouped.set(key, [value]);
+  else group.push(value);
+}
+
 async function balancesFor(
   database: Database,
   itemIds: readonly string[],
@@ -109,7 +116,7 @@ async function balancesFor(
     .execute();
 
   for (const row of rows) {
-    grouped.set(row.item_id, [...(grouped.get(row.item_id) ?? []), row]);
+    appendTo(grouped, row.item_id, row);
   }
 
   return grouped;
@@ -130,15 +137,12 @@ async function photosFor(
     .orderBy("created_at")
     .execute();
   for (const row of rows as readonly ItemPhotoRow[]) {
-    grouped.set(row.item_id, [
-      ...(grouped.get(row.item_id) ?? []),
-      {
-        id: row.id,
-        url: `/api/v1/items/${row.item_id}/photos/${row.id}`,
-        originalFileName: row.original_file_name,
-        isCover: row.display_order === 0,
-      },
-    ]);
+    appendTo(grouped, row.item_id, {
+      id: row.id,
+      url: `/api/v1/items/${row.item_id}/photos/${row.id}`,
+      originalFileName: row.original_file_name,
+      isCover: row.display_order === 0,
+    });
   }
   return grouped;
 }
@@ -666,10 +670,11 @@ export async function assigneesForJobs(
     .execute();
 
   for (const row of rows) {
-    grouped.set(row.job_id, [
-      ...(grouped.get(row.job_id) ?? []),
-      { userId: row.user_id, displayName: row.display_name, role: row.role },
-    ]);
+    appendTo(grouped, row.job_id, {
+      userId: row.user_id,
+      displayName: row.display_name,
+      role: row.role,
+    });
   }
 
   return grouped;
@@ -785,6 +790,20 @@ export async function jobSiteStock(
   database: Database,
   locationId: string,
 ): Promise<readonly LocationBalanceView[]> {
+  return (await jobSiteStockFor(database, [locationId])).get(locationId) ?? [];
+}
+
+/** What is sitting on each of several job sites, in one query, keyed by site. */
+export async function jobSiteStockFor(
+  database: Database,
+  locationIds: readonly string[],
+): Promise<Map<string, LocationBalanceView[]>> {
+  const grouped = new Map<string, LocationBalanceView[]>();
+
+  if (locationIds.length === 0) {
+    return grouped;
+  }
+
   const rows = await database
     .withSchema(SCHEMA)
     .selectFrom("stock_levels")
@@ -799,17 +818,21 @@ export async function jobSiteStock(
       "items.name as item_name",
       "items.unit as item_unit",
     ])
-    .where("stock_levels.location_id", "=", locationId)
+    .where("stock_levels.location_id", "in", locationIds)
     .where("stock_levels.quantity", ">", "0")
     .orderBy("items.reference")
     .execute();
 
-  return rows.map((row) => ({
-    locationId: row.location_id,
-    locationCode: row.code,
-    locationName: `${row.item_reference} — ${row.item_name}`,
-    kind: row.kind,
-    quantity: row.quantity,
-    unit: row.item_unit,
-  }));
+  for (const row of rows) {
+    appendTo(grouped, row.location_id, {
+      locationId: row.location_id,
+      locationCode: row.code,
+      locationName: `${row.item_reference} — ${row.item_name}`,
+      kind: row.kind,
+      quantity: row.quantity,
+      unit: row.item_unit,
+    });
+  }
+
+  return grouped;
 }
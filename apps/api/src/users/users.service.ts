@@ -59,9 +59,9 @@ export class UsersService {
       .orderBy("display_name")
       .execute();
 
-    return Promise.all(
-      rows.map(async (row) => toView(row, await this.photos.profilePhotoUrl(row.id))),
-    );
+    const photoUrls = await this.photos.profilePhotoUrls(rows.map((row) => row.id));
+
+    return rows.map((row) => toView(row, photoUrls.get(row.id) ?? null));
   }
 
   public async create(input: NewUser): Promise<UserView> {
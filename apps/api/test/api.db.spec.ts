@@ -3,12 +3,14 @@ import { randomUUID } from "node:crypto";
 import type { NestFastifyApplication } from "@nestjs/platform-fastify";
 import type { InjectOptions } from "fastify";
 import type {
+  EngineerDashboardResponse,
   ItemDetailView,
   JobResponse,
   StockOperationResponse,
   StockRequestListResponse,
   StockRequestResponse,
   TransactionListResponse,
+  UserListResponse,
 } from "@stockcontrol/contracts";
 import { capabilitiesForRole } from "@stockcontrol/contracts";
 import {
@@ -678,6 +680,41 @@ describe("users", () => {
     expect((await request(actor, "GET", "/items")).status).toBe(401);
   });
 
+  /*
+   * The photo's record is written directly: an upload would also need object
+   * storage, and the list only reads the record.
+   */
+  it("lists each user's profile photo link, or null without one", async () => {
+    const photoId = randomUUID();
+
+    await schema()
+      .insertInto("user_profile_photos")
+      .values({
+        id: photoId,
+        user_id: office.id,
+        object_key: `users/${office.id}/${photoId}`,
+        original_file_name: "office.png",
+        media_type: "image/png",
+        byte_length: 1,
+        sha256: "0".repeat(64),
+      })
+      .execute();
+
+    try {
+      const listed = await request(admin, "GET", "/users");
+      const photoUrls = new Map(
+        (listed.body as UserListResponse).users.map((user) => [user.id, user.profilePhotoUrl]),
+      );
+
+      expect(photoUrls.get(office.id)).toBe(
+        `/api/v1/users/${office.id}/profile-photo?v=${photoId}`,
+      );
+      expect(photoUrls.get(engineer.id)).toBeNull();
+    } finally {
+      await schema().deleteFrom("user_profile_photos").where("id", "=", photoId).execute();
+    }
+  });
+
   it("will not let the last active Admin be demoted", async () => {
     const response = await request(admin, "PATCH", `/users/${admin.id}`, { role: "Office" });
 
@@ -712,6 +749,60 @@ describe("dashboard", () => {
     expect(response.body).not.toHaveProperty("counts");
   });
 
+  it("shows each of an Engineer's jobs only what is on its own site", async () => {
+    const store = await seedLocation("TEST-D");
+    const [cable, bracket, screws] = await Promise.all([
+      seedItem("ITM-9412"),
+      seedItem("ITM-9411"),
+      seedItem("ITM-9413"),
+    ]);
+
+    async function assignedJob(name: string): Promise<JobResponse["job"]> {
+      const created = await request(office, "POST", "/jobs", { name, customer: "Test customer" });
+      const job = (created.body as JobResponse).job;
+      await request(office, "POST", `/jobs/${job.id}/assignments`, { userId: engineer.id });
+      return job;
+    }
+
+    async function deliver(jobId: string, itemId: string, quantity: string): Promise<void> {
+      await request(office, "POST", "/stock/receive", { itemId, locationId: store, quantity });
+      await request(engineer, "POST", `/jobs/${jobId}/reservations`, { itemId, quantity });
+      const collected = await request(
+        engineer,
+        "POST",
+        `/reservations/${await openReservationId(jobId)}/collect`,
+        { sourceLocationId: store, quantity },
+      );
+      expect(collected.status, JSON.stringify(collected.body)).toBe(201);
+    }
+
+    const first = await assignedJob("First site job");
+    const second = await assignedJob("Second site job");
+    const empty = await assignedJob("Empty site job");
+
+    await deliver(first.id, cable, "4");
+    await deliver(first.id, bracket, "2");
+    await deliver(second.id, screws, "50");
+
+    const response = await request(engineer, "GET", "/dashboard");
+    const myJobs = (response.body as EngineerDashboardResponse).myJobs;
+    const siteStock = new Map(
+      myJobs.map((job) => [
+        job.id,
+        job.jobSiteStock.map((row) => [row.locationId, row.locationName, row.quantity]),
+      ]),
+    );
+
+    expect(siteStock.get(first.id)).toEqual([
+      [first.jobSiteLocationId, "ITM-9411 — ITM-9411 test item", "2.000"],
+      [first.jobSiteLocationId, "ITM-9412 — ITM-9412 test item", "4.000"],
+    ]);
+    expect(siteStock.get(second.id)).toEqual([
+      [second.jobSiteLocationId, "ITM-9413 — ITM-9413 test item", "50.000"],
+    ]);
+    expect(siteStock.get(empty.id)).toEqual([]);
+  });
+
   it.each(["Office", "Admin"] as const)("gives %s what needs deciding", async (role) => {
     const response = await request(role === "Office" ? office : admin, "GET", "/dashboard");
 
@@ -46,6 +46,28 @@ describe("sign-in rate limiter", () => {
     expect(limiter.check("admin@example.com", "192.0.2.11").allowed).toBe(true);
   });
 
+  /*
+   * Expiry is already enforced when a window is read, so the sweep is visible
+   * only in what the limiter keeps. Evicting at the bound drops the oldest
+   * windows first, which are also the expired ones, so it cannot show the
+   * sweep either; the count of tracked windows is checked instead.
+   */
+  it("sweeps every expired window on a check and keeps the live ones", () => {
+    let now = 1_000;
+    const limiter = new SignInRateLimiter(policy({ accountLimit: 1 }), () => now);
+
+    for (let attempt = 0; attempt < 50; attempt += 1) {
+      limiter.recordFailure(`early-${String(attempt)}@example.com`, `192.0.2.${String(attempt)}`);
+    }
+    now += 30_000;
+    limiter.recordFailure("late@example.com", "198.51.100.7");
+    now += 30_000;
+
+    expect(limiter.check("late@example.com", "198.51.100.7").allowed).toBe(false);
+    /* The late account and source windows; the global one expired with the early ones. */
+    expect(limiter.trackedWindowCount).toBe(2);
+  });
+
   /*
    * The per-account and per-source buckets can each be sidestepped: spread the
    * attempts over many accounts, and vary the address the proxy chain reports.
@@ -2,7 +2,7 @@ import { describe, expect, it, vi } from "vitest";
 
 import { ApplicationFailureException } from "@stockcontrol/platform";
 
-import { IssuesService } from "../src/issues/issues.service";
+import { IssuesService, ReportThrottle } from "../src/issues/issues.service";
 
 const reporter = {
   id: "11111111-1111-4111-8111-111111111111",
@@ -185,6 +185,77 @@ describe("IssuesService", () => {
     ).resolves.toMatchObject({ issueUrl: "https://github.com/example/repo/issues/42" });
   });
 
+  it("lets a reporter file again once their window has passed", async () => {
+    let now = 1_000;
+    const service = new IssuesService(
+      { GITHUB_TOKEN: "github-token", GITHUB_REPOSITORY: "example/repo" },
+      acceptingGitHub() as never,
+      new ReportThrottle(() => now),
+    );
+    const report = {
+      title: "A problem",
+      description: "Something needs attention.",
+      page: "/dashboard",
+      reporter,
+    };
+    const later = {
+      ...report,
+      reporter: { ...reporter, id: "22222222-2222-4222-8222-222222222222" },
+    };
+
+    for (let attempt = 0; attempt < 5; attempt += 1) {
+      await service.create(report);
+    }
+    now += 30 * 60 * 1_000;
+    for (let attempt = 0; attempt < 5; attempt += 1) {
+      await service.create(later);
+    }
+    now += 30 * 60 * 1_000;
+
+    await expect(service.create(report)).resolves.toMatchObject({
+      issueUrl: "https://github.com/example/repo/issues/42",
+    });
+    await expect(service.create(later)).rejects.toMatchObject({
+      failure: { code: "request.validation_failed" },
+    });
+  });
+
+  /*
+   * A backwards clock step appends a window that expires before one already
+   * ahead of it, so the sweep stops short of it and only the read can see it
+   * has passed.
+   */
+  it("lets a reporter file again once their window passes, after a clock step back", async () => {
+    const hour = 60 * 60 * 1_000;
+    let now = 10 * hour;
+    const service = new IssuesService(
+      { GITHUB_TOKEN: "github-token", GITHUB_REPOSITORY: "example/repo" },
+      acceptingGitHub() as never,
+      new ReportThrottle(() => now),
+    );
+    const report = {
+      title: "A problem",
+      description: "Something needs attention.",
+      page: "/dashboard",
+      reporter,
+    };
+    const stepped = {
+      ...report,
+      reporter: { ...reporter, id: "22222222-2222-4222-8222-222222222222" },
+    };
+
+    await service.create(report);
+    now = 8 * hour;
+    for (let attempt = 0; attempt < 5; attempt += 1) {
+      await service.create(stepped);
+    }
+    now = 10.5 * hour;
+
+    await expect(service.create(stepped)).resolves.toMatchObject({
+      issueUrl: "https://github.com/example/repo/issues/42",
+    });
+  });
+
   it("does not spend the allowance on a report that failed validation", async () => {
     const fetchImplementation = acceptingGitHub();
     const service = configuredService(fetchImplementation);
@@ -0,0 +1,44 @@
+import { describe, expect, it } from "vitest";
+
+import { locationPaths, type PathRow } from "../../src/locations/location-paths";
+
+const row = (id: string, parentId: string | null): PathRow => ({
+  id,
+  name: id.toUpperCase(),
+  derived_parent_id: parentId,
+});
+
+describe("location paths", () => {
+  it("builds each breadcrumb from its ancestors, whatever order the rows arrive in", () => {
+    const paths = locationPaths([
+      row("shelf", "aisle"),
+      row("bin", "shelf"),
+      row("store", null),
+      row("aisle", "store"),
+      row("van", null),
+    ]);
+
+    expect(paths.get("bin")).toEqual({ path: "STORE › AISLE › SHELF › BIN", depth: 3 });
+    expect(paths.get("aisle")).toEqual({ path: "STORE › AISLE", depth: 1 });
+    expect(paths.get("van")).toEqual({ path: "VAN", depth: 0 });
+  });
+
+  it("treats a parent that is not in the rows as the top of the path", () => {
+    expect(locationPaths([row("shelf", "elsewhere")]).get("shelf")).toEqual({
+      path: "SHELF",
+      depth: 0,
+    });
+  });
+
+  /*
+   * Containment cannot produce a cycle, but a damaged chain must still give
+   * every location a finite breadcrumb rather than looping.
+   */
+  it("goes once round a parent cycle, ending each member's path at itself", () => {
+    const paths = locationPaths([row("inside", "a"), row("a", "b"), row("b", "a")]);
+
+    expect(paths.get("a")).toEqual({ path: "B › A", depth: 1 });
+    expect(paths.get("b")).toEqual({ path: "A › B", depth: 1 });
+    expect(paths.get("inside")).toEqual({ path: "B › A › INSIDE", depth: 2 });
+  });
+});
@@ -1,7 +1,9 @@
 export {
+  childrenByParent,
   deriveContainment,
   derivedTree,
   descendantIds,
+  descendantsIn,
   PATH_SEPARATOR,
   type ContainmentPlacement,
   type ContainmentTreeInput,
@@ -1,4 +1,4 @@
-import { areaOf, geometryContains, type MapGeometry } from "./geometry.js";
+import { areaOf, boundsOf, geometryContains, type MapGeometry } from "./geometry.js";
 
 /**
  * The implicit hierarchy. Nothing here is stored by a user: a location's parent
@@ -27,16 +27,21 @@ export interface ContainmentTreeNode {
 
 export const PATH_SEPARATOR = " › ";
 
+interface RankedPlacement {
+  readonly placement: ContainmentPlacement;
+  readonly area: number;
+}
+
 /**
  * Shapes ranked smallest first, so a parent always ranks after its children and
  * the containment relation cannot close a loop. Equal areas are separated by
  * z-order — the shape drawn on top is the one that reads as being inside — and
  * finally by id so the result never depends on input order.
  */
-const byContainmentRank = (left: ContainmentPlacement, right: ContainmentPlacement): number =>
-  areaOf(left.geometry) - areaOf(right.geometry) ||
-  right.zOrder - left.zOrder ||
-  (left.id < right.id ? -1 : left.id > right.id ? 1 : 0);
+const byContainmentRank = (left: RankedPlacement, right: RankedPlacement): number =>
+  left.area - right.area ||
+  right.placement.zOrder - left.placement.zOrder ||
+  (left.placement.id < right.placement.id ? -1 : left.placement.id > right.placement.id ? 1 : 0);
 
 /**
  * Maps each shape to the smallest shape that wholly contains it, or to null when
@@ -45,14 +50,27 @@ const byContainmentRank = (left: ContainmentPlacement, right: ContainmentPlaceme
 export const deriveContainment = (
   placements: readonly ContainmentPlacement[],
 ): ReadonlyMap<string, string | null> => {
-  const ranked = [...placements].sort(byContainmentRank);
+  /*
+   * The sort visits each shape in about log n comparisons, and a polygon's area
+   * is a walk over all of its vertices, so it is taken once per shape up front.
+   */
+  const ranked = placements
+    .map((placement) => ({ placement, area: areaOf(placement.geometry) }))
+    .sort(byContainmentRank)
+    .map(({ placement }) => placement);
+  /*
+   * Every shape is tested against every larger one, so its bounding box would
+   * otherwise be rebuilt once per pair — for a polygon, a walk over all of its
+   * vertices each time.
+   */
+  const bounds = ranked.map((placement) => boundsOf(placement.geometry));
   const parents = new Map<string, string | null>();
   for (let index = 0; index < ranked.length; index += 1) {
     const child = ranked[index]!;
     let parentId: string | null = null;
     for (let candidate = index + 1; candidate < ranked.length; candidate += 1) {
       const outer = ranked[candidate]!;
-      if (geometryContains(outer.geometry, child.geometry)) {
+      if (geometryContains(outer.geometry, child.geometry, bounds[candidate], bounds[index])) {
         parentId = outer.id;
         break;
       }
@@ -86,21 +104,26 @@ export const derivedTree = (
     );
   }
   const nodes: ContainmentTreeNode[] = [];
-  const visit = (parentId: string | null, depth: number, prefix: readonly string[]): void => {
+  /*
+   * Each level extends its parent's finished path, rather than copying and
+   * re-joining the whole trail of names at every node.
+   */
+  const visit = (parentId: string | null, depth: number, parentPath: string | null): void => {
     for (const placement of children.get(parentId) ?? []) {
-      const trail = [...prefix, placement.name];
+      const path =
+        parentPath === null ? placement.name : `${parentPath}${PATH_SEPARATOR}${placement.name}`;
       nodes.push({
         id: placement.id,
         name: placement.name,
         parentId,
         depth,
-        path: trail.join(PATH_SEPARATOR),
+        path,
         childIds: (children.get(placement.id) ?? []).map((child) => child.id),
       });
-      visit(placement.id, depth + 1, trail);
+      visit(placement.id, depth + 1, path);
     }
   };
-  visit(null, 0, []);
+  visit(null, 0, null);
   /* Anything unreachable would mean a cycle, which the ranking rules out. */
   if (nodes.length !== byId.size) {
     throw new Error("Derived containment did not cover every placement.");
@@ -108,11 +131,10 @@ export const derivedTree = (
   return nodes;
 };
 
-/** Every id contained by `rootId`, directly or at any depth, including itself. */
-export const descendantIds = (
+/** Each parent's direct children, inverted from a child-to-parent map. */
+export const childrenByParent = (
   parents: ReadonlyMap<string, string | null>,
-  rootId: string,
-): ReadonlySet<string> => {
+): ReadonlyMap<string, readonly string[]> => {
   const children = new Map<string, string[]>();
   for (const [id, parentId] of parents) {
     if (parentId === null) continue;
@@ -120,6 +142,23 @@ export const descendantIds = (
     siblings.push(id);
     children.set(parentId, siblings);
   }
+  return children;
+};
+
+/** Every id contained by `rootId`, directly or at any depth, including itself. */
+export const descendantIds = (
+  parents: ReadonlyMap<string, string | null>,
+  rootId: string,
+): ReadonlySet<string> => descendantsIn(childrenByParent(parents), rootId);
+
+/**
+ * The same, read from a children index built once by `childrenByParent`, for a
+ * caller asking about many roots over the same parents.
+ */
+export const descendantsIn = (
+  children: ReadonlyMap<string, readonly string[]>,
+  rootId: string,
+): ReadonlySet<string> => {
   const found = new Set<string>([rootId]);
   const pending = [rootId];
   while (pending.length > 0) {
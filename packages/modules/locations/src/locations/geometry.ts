@@ -182,14 +182,21 @@ export const boundsOf = (geometry: MapGeometry): GeometryBounds => {
       maxY: geometry.y + geometry.height,
     };
   }
-  const xs = geometry.points.map((point) => point.x);
-  const ys = geometry.points.map((point) => point.y);
-  return {
-    minX: Math.min(...xs),
-    minY: Math.min(...ys),
-    maxX: Math.max(...xs),
-    maxY: Math.max(...ys),
-  };
+  /*
+   * One pass and no intermediate arrays: this runs for every shape whenever
+   * containment or overlap is checked.
+   */
+  let minX = Number.POSITIVE_INFINITY;
+  let minY = Number.POSITIVE_INFINITY;
+  let maxX = Number.NEGATIVE_INFINITY;
+  let maxY = Number.NEGATIVE_INFINITY;
+  for (const point of geometry.points) {
+    minX = Math.min(minX, point.x);
+    minY = Math.min(minY, point.y);
+    maxX = Math.max(maxX, point.x);
+    maxY = Math.max(maxY, point.y);
+  }
+  return { minX, minY, maxX, maxY };
 };
 
 /**
@@ -239,10 +246,16 @@ const properlyCrosses = (
  * Whether `inner` lies wholly within `outer`. Every corner of the inner shape
  * must be inside the outer one, and no pair of edges may cross, which together
  * settle containment for the simple polygons this editor can produce.
+ *
+ * A caller testing each shape against many others can pass bounds it has
+ * already computed rather than have them recomputed for every pair.
  */
-export const geometryContains = (outer: MapGeometry, inner: MapGeometry): boolean => {
-  const outerBounds = boundsOf(outer);
-  const innerBounds = boundsOf(inner);
+export const geometryContains = (
+  outer: MapGeometry,
+  inner: MapGeometry,
+  outerBounds: GeometryBounds = boundsOf(outer),
+  innerBounds: GeometryBounds = boundsOf(inner),
+): boolean => {
   if (
     innerBounds.minX < outerBounds.minX - MIN_AREA ||
     innerBounds.minY < outerBounds.minY - MIN_AREA ||
@@ -1,9 +1,11 @@
 import { describe, expect, it } from "vitest";
 
 import {
+  childrenByParent,
   derivedTree,
   deriveContainment,
   descendantIds,
+  descendantsIn,
   type ContainmentPlacement,
 } from "../src/locations/containment.js";
 import {
@@ -227,4 +229,16 @@ describe("descendantIds", () => {
     expect([...descendantIds(parents, id(1))].sort()).toEqual([id(1), id(2), id(3), id(4)]);
     expect([...descendantIds(parents, id(4))]).toEqual([id(4)]);
   });
+
+  it("answers the same from a prebuilt children index", () => {
+    const parents = deriveContainment([
+      place(1, rectangle(0, 0, 1, 1)),
+      place(2, rectangle(0.1, 0.1, 0.5, 0.5)),
+      place(3, rectangle(0.2, 0.2, 0.1, 0.1)),
+    ]);
+    const children = childrenByParent(parents);
+    expect(children.get(id(1))).toEqual([id(2)]);
+    expect([...descendantsIn(children, id(1))].sort()).toEqual([id(1), id(2), id(3)]);
+    expect([...descendantsIn(children, id(3))]).toEqual([id(3)]);
+  });
 });
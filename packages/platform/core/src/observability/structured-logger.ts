@@ -15,6 +15,15 @@ const consoleDestination: LogDestination = {
   },
 };
 
+const STRUCTURED_LEVELS: Readonly<Record<LogLevel, StructuredLogLevel>> = {
+  debug: "debug",
+  error: "error",
+  fatal: "fatal",
+  log: "info",
+  verbose: "trace",
+  warn: "warn",
+};
+
 const REDACTED_KEY_SUFFIXES = [
   "authorization",
   "cookie",
@@ -28,9 +37,29 @@ const REDACTED_KEY_SUFFIXES = [
   "totpcode",
 ] as const;
 
+/*
+ * Records reuse a small vocabulary of field names, so each one is normalised
+ * and matched against the suffixes once rather than on every record. The bound
+ * stops an event keyed by data (a map of ids, say) from growing it without end.
+ */
+const REDACTED_KEY_CACHE_LIMIT = 1_000;
+const redactedKeys = new Map<string, boolean>();
+
 const isRedactedKey = (key: string): boolean => {
+  const cached = redactedKeys.get(key);
+  if (cached !== undefined) {
+    return cached;
+  }
+
   const normalised = key.replaceAll(/[^A-Za-z0-9]/gu, "").toLowerCase();
-  return REDACTED_KEY_SUFFIXES.some((suffix) => normalised.endsWith(suffix));
+  const redacted = REDACTED_KEY_SUFFIXES.some((suffix) => normalised.endsWith(suffix));
+
+  if (redactedKeys.size >= REDACTED_KEY_CACHE_LIMIT) {
+    redactedKeys.clear();
+  }
+
+  redactedKeys.set(key, redacted);
+  return redacted;
 };
 
 const sanitize = (value: unknown, seen: WeakSet<object> = new WeakSet<object>()): unknown => {
@@ -66,7 +95,11 @@ const sanitize = (value: unknown, seen: WeakSet<object> = new WeakSet<object>())
 };
 
 export class StructuredLogger implements LoggerService {
-  private enabledLevels: ReadonlySet<LogLevel> | undefined;
+  /*
+   * Held in the structured vocabulary so that the check on every write is a
+   * single lookup, with Nest's names translated once when the levels are set.
+   */
+  private enabledLevels: ReadonlySet<StructuredLogLevel> | undefined;
 
   public constructor(
     private readonly context: CorrelationContext,
@@ -99,7 +132,7 @@ export class StructuredLogger implements LoggerService {
   }
 
   public setLogLevels(levels: LogLevel[]): void {
-    this.enabledLevels = new Set(levels);
+    this.enabledLevels = new Set(levels.map((level) => STRUCTURED_LEVELS[level]));
   }
 
   private write(
@@ -132,11 +165,6 @@ export class StructuredLogger implements LoggerService {
   }
 
   private isEnabled(level: StructuredLogLevel): boolean {
-    if (this.enabledLevels === undefined) {
-      return true;
-    }
-
-    const nestLevel: LogLevel = level === "info" ? "log" : level === "trace" ? "verbose" : level;
-    return this.enabledLevels.has(nestLevel);
+    return this.enabledLevels?.has(level) ?? true;
   }
 }
@@ -117,6 +117,18 @@ describe("StructuredLogger", () => {
     expect(records[0]?.parameters).toEqual([{ refresh_token: "[REDACTED]", publicValue: true }]);
   });
 
+  it("keeps redacting once many distinct keys have been logged", () => {
+    const { logger, records } = capturingLogger();
+    const noise = Object.fromEntries(
+      Array.from({ length: 2_500 }, (_, index) => [`field${String(index)}`, index]),
+    );
+
+    logger.log(noise);
+    logger.log({ sessionToken: "secret", field1: 1 });
+
+    expect(records[1]?.event).toEqual({ sessionToken: "[REDACTED]", field1: 1 });
+  });
+
   it("routes default output to stdout except for error and fatal records", () => {
     const stdout = vi.spyOn(process.stdout, "write").mockImplementation(() => true);
     const stderr = vi.spyOn(process.stderr, "write").mockImplementation(() => true);
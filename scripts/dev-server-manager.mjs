@@ -20,16 +20,14 @@ const ensureStateDir = () => {
   fs.mkdirSync(stateDir, { recursive: true });
 };
 
+// Callers must have run ensureStateDir() first.
 const appendLog = (text) => {
-  ensureStateDir();
   fs.appendFileSync(logFile, text, "utf8");
 };
 
+// A missing pid file is just another failed read, so there is no separate
+// existence check to race a concurrent stop.
 const readPid = () => {
-  if (!fs.existsSync(pidFile)) {
-    return undefined;
-  }
-
   try {
     const value = fs.readFileSync(pidFile, "utf8").trim();
     return value.length > 0 ? Number(value) : undefined;
@@ -44,9 +42,7 @@ const writePid = (pid) => {
 };
 
 const removePid = () => {
-  if (fs.existsSync(pidFile)) {
-    fs.rmSync(pidFile, { force: true });
-  }
+  fs.rmSync(pidFile, { force: true });
 };
 
 const isProcessRunning = (pid) => {
@@ -149,26 +145,34 @@ const start = async () => {
     stdio: ["ignore", "pipe", "pipe"],
   });
 
+  // The dev stack prints in many small chunks; one open append stream writes
+  // them off the event loop.
+  const log = fs.createWriteStream(logFile, { flags: "a" });
+
   child.stdout.on("data", (chunk) => {
-    const text = chunk.toString();
-    appendLog(text);
-    process.stdout.write(text);
+    log.write(chunk);
+    process.stdout.write(chunk);
   });
 
   child.stderr.on("data", (chunk) => {
-    const text = chunk.toString();
-    appendLog(text);
-    process.stderr.write(text);
+    log.write(chunk);
+    process.stderr.write(chunk);
   });
 
   child.on("error", (error) => {
-    appendLog(`[${new Date().toISOString()}] Failed to start dev server: ${error.message}\n`);
+    log.write(`[${new Date().toISOString()}] Failed to start dev server: ${error.message}\n`);
     console.error(`Failed to start dev server: ${error.message}`);
   });
 
+  // "close" follows the last chunk from both pipes, so nothing is written
+  // to the stream after it has ended.
+  child.on("close", () => {
+    log.end();
+  });
+
   child.on("exit", (code) => {
     if (code !== 0) {
-      appendLog(`[${new Date().toISOString()}] Dev server exited with code ${code}.\n`);
+      log.write(`[${new Date().toISOString()}] Dev server exited with code ${code}.\n`);
     }
     // A failure in any parallel workspace script (e.g. EADDRINUSE) makes pnpm
     // exit on its own, outside of the explicit stop() path. Without this, the
@@ -228,27 +232,52 @@ const status = () => {
 
 const logs = () => {
   ensureStateDir();
-  if (!fs.existsSync(logFile)) {
-    fs.writeFileSync(logFile, "", "utf8");
-  }
-
-  const content = fs.readFileSync(logFile, "utf8");
-  const lines = content.split(/\r?\n/).filter((line) => line.length > 0);
+  // Appending nothing creates the log if it is missing and leaves it alone if not.
+  fs.appendFileSync(logFile, "");
+
+  const content = fs.readFileSync(logFile);
+  const lines = content
+    .toString("utf8")
+    .split(/\r?\n/)
+    .filter((line) => line.length > 0);
   const tail = 80;
   if (lines.length > 0) {
     console.log(lines.slice(-tail).join("\n"));
   }
 
+  // Print exactly the bytes appended since the previous event. Editors and the
+  // dev stack write in bursts that the watcher coalesces into one event, so
+  // every line of a burst has to come from the one read. Reading from an offset
+  // also keeps each event's cost proportional to what changed rather than to
+  // the size of the log.
+  let offset = content.length;
+  const printAppended = () => {
+    const fd = fs.openSync(logFile, "r");
+    try {
+      const { size } = fs.fstatSync(fd);
+      if (size < offset) {
+        // The log was truncated or replaced; start again from its beginning.
+        offset = 0;
+      }
+      if (size === offset) {
+        return;
+      }
+
+      const appended = Buffer.alloc(size - offset);
+      const read = fs.readSync(fd, appended, 0, appended.length, offset);
+      offset += read;
+      process.stdout.write(appended.subarray(0, read));
+    } finally {
+      fs.closeSync(fd);
+    }
+  };
+
   const watcher = fs.watch(logFile, (eventType) => {
     if (eventType !== "change") {
       return;
     }
 
-    const updated = fs.readFileSync(logFile, "utf8");
-    const lastLine = updated.split(/\r?\n/).slice(-1)[0] ?? "";
-    if (lastLine.length > 0) {
-      process.stdout.write(`${lastLine}\n`);
-    }
+    printAppended();
   });
 
   const handleExit = () => {